@@ -3,6 +3,7 @@
 
 import argparse
 import json
+import shutil
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional
@@ -327,12 +328,10 @@ def create_html_report(run_id: Optional[str], base_dir: Path) -> Path:
 
     for key, filepath in analysis_files.items():
         if filepath.exists():
-            dest = output_dir / filepath.name
-            dest.write_bytes(filepath.read_bytes())
+            shutil.copyfile(filepath, output_dir / filepath.name)
 
     if manifest_path.exists():
-        manifest_dest = output_dir / manifest_path.name
-        manifest_dest.write_bytes(manifest_path.read_bytes())
+        shutil.copyfile(manifest_path, output_dir / manifest_path.name)
 
     raw_file = _resolve_existing_file(base_dir, f"data/raw/scopus_search_{resolved_run_id}")
     processed_file = _resolve_existing_file(
@@ -340,12 +339,10 @@ def create_html_report(run_id: Optional[str], base_dir: Path) -> Path:
     )
 
     if raw_file:
-        dest = output_dir / ("raw_data" + raw_file.suffix)
-        dest.write_bytes(raw_file.read_bytes())
+        shutil.copyfile(raw_file, output_dir / ("raw_data" + raw_file.suffix))
 
     if processed_file:
-        dest = output_dir / ("clean_data" + processed_file.suffix)
-        dest.write_bytes(processed_file.read_bytes())
+        shutil.copyfile(processed_file, output_dir / ("clean_data" + processed_file.suffix))
 
     return report_path
 
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import json
 import logging
 from datetime import datetime, timezone
 from importlib import import_module
@@ -8,7 +7,8 @@ from importlib.util import find_spec
 from pathlib import Path
 from typing import TYPE_CHECKING, Optional
 
-from pybibliometric_analysis.io_utils import read_table
+from pybibliometric_analysis.frame_utils import count_by_year
+from pybibliometric_analysis.io_utils import read_table, setup_logger, write_json
 
 if TYPE_CHECKING:
     import pandas as pd
@@ -21,21 +21,7 @@ def _lazy_pandas():
 
 
 def setup_logging(log_path: Path) -> logging.Logger:
-    log_path.parent.mkdir(parents=True, exist_ok=True)
-    logger = logging.getLogger("pybibliometric_analysis.analyze")
-    logger.setLevel(logging.INFO)
-
-    formatter = logging.Formatter("%(asctime)s %(levelname)s %(message)s")
-    file_handler = logging.FileHandler(log_path)
-    file_handler.setFormatter(formatter)
-
-    stream_handler = logging.StreamHandler()
-    stream_handler.setFormatter(formatter)
-
-    logger.handlers = []
-    logger.addHandler(file_handler)
-    logger.addHandler(stream_handler)
-    return logger
+    return setup_logger("pybibliometric_analysis.analyze", log_path)
 
 
 def _latest_clean_file(base_dir: Path) -> Path:
@@ -62,7 +48,7 @@ def _filter_years(
 ) -> "pd.DataFrame":
     if "pub_year" not in df.columns:
         return df
-    filtered = df.dropna(subset=["pub_year"]).copy()
+    filtered = df.dropna(subset=["pub_year"])
     if min_year is not None:
         filtered = filtered[filtered["pub_year"] >= min_year]
     if max_year is not None:
@@ -71,19 +57,24 @@ def _filter_years(
 
 
 def _compute_yoy(pubs_by_year: "pd.DataFrame") -> "pd.DataFrame":
+    import numpy as np
+
     pd = _lazy_pandas()
-    pubs_by_year = pubs_by_year.sort_values("pub_year")
-    pubs_by_year["prev_count"] = pubs_by_year["count"].shift(1)
-    pubs_by_year["yoy_abs"] = pubs_by_year["count"] - pubs_by_year["prev_count"]
-    pubs_by_year["yoy_pct"] = pd.NA
-    mask = pubs_by_year["prev_count"] > 0
-    pubs_by_year.loc[mask, "yoy_pct"] = (
-        (pubs_by_year.loc[mask, "yoy_abs"] / pubs_by_year.loc[mask, "prev_count"]) * 100
+    ordered = pubs_by_year.sort_values("pub_year").reset_index(drop=True)
+    counts = ordered["count"].to_numpy(dtype=np.float64)
+    prev = np.full_like(counts, np.nan)
+    prev[1:] = counts[:-1]
+    yoy_abs = counts - prev
+    with np.errstate(divide="ignore", invalid="ignore"):
+        yoy_pct = np.where(prev > 0, yoy_abs / prev * 100, np.nan)
+    return pd.DataFrame(
+        {
+            "year": ordered["pub_year"],
+            "count": ordered["count"],
+            "yoy_abs": yoy_abs,
+            "yoy_pct": yoy_pct,
+        }
     )
-    pubs_by_year["yoy_pct"] = pd.to_numeric(pubs_by_year["yoy_pct"], errors="coerce")
-    return pubs_by_year.rename(columns={"pub_year": "year"})[
-        ["year", "count", "yoy_abs", "yoy_pct"]
-    ]
 
 
 def _compute_cagr(pubs_by_year: "pd.DataFrame") -> dict:
@@ -128,6 +119,24 @@ def _compute_avg_last5_vs_prev5(pubs_by_year: "pd.DataFrame") -> dict:
     return {"avg_last5": avg_last5, "avg_prev5": avg_prev5, "avg_last5_vs_prev5": ratio}
 
 
+def _save_line_plot(
+    figure_cls: type,
+    x: "pd.Series",
+    y: "pd.Series",
+    title: str,
+    ylabel: str,
+    path: Path,
+) -> None:
+    fig = figure_cls()
+    ax = fig.subplots()
+    ax.plot(x, y, marker="o")
+    ax.set_title(title)
+    ax.set_xlabel("Year")
+    ax.set_ylabel(ylabel)
+    fig.tight_layout()
+    fig.savefig(path)
+
+
 def _maybe_plot(
     figures: bool,
     pubs_by_year: "pd.DataFrame",
@@ -144,35 +153,36 @@ def _maybe_plot(
     if pubs_by_year.empty:
         logger.warning("No publications-by-year data; skipping figures.")
         return
-    plt = import_module("matplotlib.pyplot")
+    # Figure objects render through the Agg canvas directly, which avoids importing
+    # pyplot and resolving an interactive backend just to write two PNGs.
+    figure_cls = import_module("matplotlib.figure").Figure
     figures_dir = base_dir / "outputs" / "figures"
     figures_dir.mkdir(parents=True, exist_ok=True)
 
-    plt.figure()
-    plt.plot(pubs_by_year["pub_year"], pubs_by_year["count"], marker="o")
-    plt.title("Publications by Year")
-    plt.xlabel("Year")
-    plt.ylabel("Count")
-    plt.tight_layout()
-    plt.savefig(figures_dir / f"pubs_by_year_{run_id}.png")
-    plt.close()
+    _save_line_plot(
+        figure_cls,
+        pubs_by_year["pub_year"],
+        pubs_by_year["count"],
+        "Publications by Year",
+        "Count",
+        figures_dir / f"pubs_by_year_{run_id}.png",
+    )
 
-    yoy_plot = yoy.copy()
     pd = _lazy_pandas()
-    yoy_plot["yoy_pct"] = pd.to_numeric(yoy_plot["yoy_pct"], errors="coerce")
+    yoy_plot = yoy.assign(yoy_pct=pd.to_numeric(yoy["yoy_pct"], errors="coerce"))
     yoy_plot = yoy_plot.dropna(subset=["year", "yoy_pct"])
     if yoy_plot.empty:
         logger.warning("No YoY data available for plotting; skipping YoY figure.")
         return
 
-    plt.figure()
-    plt.plot(yoy_plot["year"], yoy_plot["yoy_pct"], marker="o")
-    plt.title("Year-over-Year Growth")
-    plt.xlabel("Year")
-    plt.ylabel("YoY %")
-    plt.tight_layout()
-    plt.savefig(figures_dir / f"yoy_growth_{run_id}.png")
-    plt.close()
+    _save_line_plot(
+        figure_cls,
+        yoy_plot["year"],
+        yoy_plot["yoy_pct"],
+        "Year-over-Year Growth",
+        "YoY %",
+        figures_dir / f"yoy_growth_{run_id}.png",
+    )
 
 
 def run_analyze(
@@ -206,16 +216,10 @@ def run_analyze(
     resolved_run_id = run_id or _extract_run_id(clean_path)
     logger.info("Analyzing run_id=%s input=%s", resolved_run_id, clean_path)
 
-    df = read_table(clean_path)
+    df = read_table(clean_path, columns=["pub_year"])
     df = _filter_years(df, min_year, max_year)
 
-    pubs_by_year = (
-        df.dropna(subset=["pub_year"])
-        .groupby("pub_year")
-        .size()
-        .reset_index(name="count")
-        .sort_values("pub_year")
-    )
+    pubs_by_year = count_by_year(df["pub_year"])
     analysis_dir = base_dir / "outputs" / "analysis"
     analysis_dir.mkdir(parents=True, exist_ok=True)
     pubs_by_year_path = analysis_dir / f"pubs_by_year_{resolved_run_id}.csv"
@@ -249,10 +253,9 @@ def run_analyze(
         "output_format": "csv",
         "yoy_pct_units": "percent",
     }
-    (base_dir / "outputs" / "methods").mkdir(parents=True, exist_ok=True)
-    (base_dir / "outputs" / "methods" / f"analysis_manifest_{resolved_run_id}.json").write_text(
-        json.dumps(analysis_manifest, indent=2, sort_keys=True),
-        encoding="utf-8",
+    write_json(
+        analysis_manifest,
+        base_dir / "outputs" / "methods" / f"analysis_manifest_{resolved_run_id}.json",
     )
 
     _maybe_plot(figures, pubs_by_year, yoy, resolved_run_id, base_dir, logger)
@@ -1,15 +1,25 @@
 from __future__ import annotations
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import TYPE_CHECKING, Optional
 
-from pybibliometric_analysis.io_utils import read_table, write_json, write_table
+from pybibliometric_analysis.frame_utils import count_by_year, cover_years, string_dtype
+from pybibliometric_analysis.io_utils import (
+    detect_parquet_support,
+    read_table,
+    setup_logger,
+    write_json,
+    write_table,
+)
 
 if TYPE_CHECKING:
     import pandas as pd
 
+_JOURNAL_COLUMNS = ("prism:publicationName", "publicationName", "journal", "sourceTitle")
+
 
 def _lazy_pandas():
     import pandas as pd
@@ -18,21 +28,7 @@ def _lazy_pandas():
 
 
 def setup_logging(log_path: Path) -> logging.Logger:
-    log_path.parent.mkdir(parents=True, exist_ok=True)
-    logger = logging.getLogger("pybibliometric_analysis.clean")
-    logger.setLevel(logging.INFO)
-
-    formatter = logging.Formatter("%(asctime)s %(levelname)s %(message)s")
-    file_handler = logging.FileHandler(log_path)
-    file_handler.setFormatter(formatter)
-
-    stream_handler = logging.StreamHandler()
-    stream_handler.setFormatter(formatter)
-
-    logger.handlers = []
-    logger.addHandler(file_handler)
-    logger.addHandler(stream_handler)
-    return logger
+    return setup_logger("pybibliometric_analysis.clean", log_path)
 
 
 def _latest_raw_file(base_dir: Path) -> Path:
@@ -54,68 +50,80 @@ def _extract_run_id(path: Path) -> str:
     return name
 
 
-def _coerce_year(value: Optional[str]) -> Optional[int]:
-    if value is None:
-        return None
-    text = str(value).strip()
-    if not text:
-        return None
-    if len(text) >= 4 and text[:4].isdigit():
-        return int(text[:4])
-    return None
-
-
-def _derive_pub_year(df: "pd.DataFrame") -> "pd.DataFrame":
+def _pub_year_column(df: "pd.DataFrame") -> "pd.Series":
     pd = _lazy_pandas()
-    if "pub_year" not in df.columns:
-        df["pub_year"] = pd.NA
+    if "pub_year" in df.columns:
+        pub_year = pd.to_numeric(df["pub_year"], errors="coerce")
+    else:
+        pub_year = pd.Series(float("nan"), index=df.index)
     cover_col = "coverDate" if "coverDate" in df.columns else "cover_date"
     if cover_col in df.columns:
-        cover_years = df[cover_col].apply(_coerce_year)
-    else:
-        cover_years = pd.Series([None] * len(df))
-    df["pub_year"] = pd.to_numeric(df["pub_year"], errors="coerce")
-    cover_years = pd.to_numeric(cover_years, errors="coerce")
-    df["pub_year"] = df["pub_year"].fillna(cover_years)
-    return df
+        pub_year = pub_year.fillna(cover_years(df[cover_col]))
+    return pub_year
 
 
-def _fill_author_names(df: "pd.DataFrame") -> "pd.DataFrame":
+def _author_names_column(df: "pd.DataFrame") -> "pd.Series":
     pd = _lazy_pandas()
-    if "author_names" not in df.columns:
-        df["author_names"] = pd.NA
-    fallback_col = None
-    for candidate in ("creator", "dc:creator"):
-        if candidate in df.columns:
-            fallback_col = candidate
-            break
+    if "author_names" in df.columns:
+        author_names = df["author_names"]
+    else:
+        author_names = pd.Series(pd.NA, index=df.index, dtype=object)
+    fallback_col = next((c for c in ("creator", "dc:creator") if c in df.columns), None)
     if fallback_col:
-        df["author_names"] = df["author_names"].fillna(df[fallback_col])
-    return df
+        author_names = author_names.fillna(df[fallback_col])
+    return author_names
+
+
+def _journal_column(df: "pd.DataFrame") -> Optional[str]:
+    return next((c for c in _JOURNAL_COLUMNS if c in df.columns), None)
+
+
+def _clean_columns(df: "pd.DataFrame") -> "pd.DataFrame":
+    new_cols = {
+        "pub_year": _pub_year_column(df),
+        "author_names": _author_names_column(df),
+    }
+    journal_col = _journal_column(df)
+    if journal_col:
+        new_cols[journal_col] = df[journal_col].astype(string_dtype()).str.strip()
+    return df.assign(**new_cols)
+
+
+def _value_counts(values: "pd.Series", out_col: str) -> "pd.DataFrame":
+    pd = _lazy_pandas()
+    values = values.dropna()
+    if detect_parquet_support():
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+        counted = pc.value_counts(pa.array(values))
+        counts = pd.DataFrame(
+            {
+                out_col: counted.field("values").to_pandas(),
+                "count": counted.field("counts").to_pandas(),
+            }
+        )
+    else:
+        counts = values.value_counts().reset_index()
+        counts.columns = [out_col, "count"]
+    # Ties are ordered by value so both backends write identical tables.
+    return counts.sort_values(
+        ["count", out_col], ascending=[False, True], kind="stable", ignore_index=True
+    )
 
 
-def _normalize_journal(df: "pd.DataFrame") -> "pd.DataFrame":
-    col = None
-    for candidate in ("prism:publicationName", "publicationName", "journal", "sourceTitle"):
-        if candidate in df.columns:
-            col = candidate
-            break
-    if col:
-        df[col] = df[col].astype(str).str.strip()
-    return df
+def _count_journals(journals: "pd.Series") -> "pd.DataFrame":
+    # Stripped by _clean_columns; missing journals stay NA and are not counted.
+    return _value_counts(journals, "journal")
 
 
 def _split_and_count(series: "pd.Series", sep: str = ";") -> "pd.DataFrame":
     pd = _lazy_pandas()
-    items = []
-    for value in series.dropna().astype(str):
-        parts = [part.strip() for part in value.split(sep) if part.strip()]
-        items.extend(parts)
-    if not items:
+    tokens = series.dropna().astype(string_dtype()).str.split(sep).explode().str.strip()
+    tokens = tokens[tokens != ""]
+    if tokens.empty:
         return pd.DataFrame(columns=["item", "count"])
-    counts = pd.Series(items).value_counts().reset_index()
-    counts.columns = ["item", "count"]
-    return counts
+    return _value_counts(tokens, "item")
 
 
 def run_clean(
@@ -152,9 +160,7 @@ def run_clean(
         df = df.drop_duplicates(subset=["eid"])
     deduped_rows = len(df)
 
-    df = _derive_pub_year(df)
-    df = _fill_author_names(df)
-    df = _normalize_journal(df)
+    df = _clean_columns(df)
 
     output_base = base_dir / "data" / "processed" / f"scopus_clean_{resolved_run_id}"
 
@@ -172,55 +178,48 @@ def run_clean(
 
     analysis_dir = base_dir / "outputs" / "analysis"
     analysis_dir.mkdir(parents=True, exist_ok=True)
+    output_tables = {
+        name: analysis_dir / f"{name}_{resolved_run_id}.csv"
+        for name in ("pubs_by_year", "top_journals", "top_authors", "keyword_freq")
+    }
 
-    pubs_by_year = (
-        df.dropna(subset=["pub_year"])
-        .groupby("pub_year")
-        .size()
-        .reset_index(name="count")
-        .sort_values("pub_year")
-    )
-    pubs_by_year.to_csv(analysis_dir / f"pubs_by_year_{resolved_run_id}.csv", index=False)
-
-    journal_col = next(
-        (
-            c
-            for c in ("prism:publicationName", "publicationName", "journal", "sourceTitle")
-            if c in df.columns
-        ),
+    journal_col = _journal_column(df)
+    keyword_col = next(
+        (c for c in ("authkeywords", "keywords", "author_keywords") if c in df.columns),
         None,
     )
-    if journal_col:
-        journals = (
-            df[journal_col]
-            .dropna()
-            .astype(str)
-            .str.strip()
-            .value_counts()
-            .reset_index()
+
+    # The four summaries only read the cleaned frame, so they are computed side by side;
+    # Arrow-backed string kernels release the GIL while splitting and counting.
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        pubs_future = executor.submit(count_by_year, df["pub_year"])
+        journals_future = (
+            executor.submit(_count_journals, df[journal_col]) if journal_col else None
         )
-        journals.columns = ["journal", "count"]
-    else:
+        authors_future = executor.submit(_split_and_count, df["author_names"])
+        keywords_future = (
+            executor.submit(_split_and_count, df[keyword_col]) if keyword_col else None
+        )
+        pubs_by_year = pubs_future.result()
+        journals = journals_future.result() if journals_future else None
+        authors = authors_future.result()
+        keywords = keywords_future.result() if keywords_future else None
+
+    pubs_by_year.to_csv(output_tables["pubs_by_year"], index=False)
+
+    if journals is None:
         journals = _lazy_pandas().DataFrame(columns=["journal", "count"])
         logger.warning("Journal column not found; top_journals will be empty.")
-    journals.to_csv(analysis_dir / f"top_journals_{resolved_run_id}.csv", index=False)
+    journals.to_csv(output_tables["top_journals"], index=False)
 
-    authors = _split_and_count(df["author_names"]) if "author_names" in df.columns else None
-    if authors is None or authors.empty:
-        authors = _lazy_pandas().DataFrame(columns=["item", "count"])
+    if authors.empty:
         logger.warning("Author names missing; top_authors will be empty.")
-    authors.to_csv(analysis_dir / f"top_authors_{resolved_run_id}.csv", index=False)
+    authors.to_csv(output_tables["top_authors"], index=False)
 
-    keyword_col = next(
-        (c for c in ("authkeywords", "keywords", "author_keywords") if c in df.columns),
-        None,
-    )
-    if keyword_col:
-        keywords = _split_and_count(df[keyword_col])
-    else:
+    if keywords is None:
         keywords = _lazy_pandas().DataFrame(columns=["item", "count"])
         logger.warning("Keyword column not found; keyword_freq will be empty.")
-    keywords.to_csv(analysis_dir / f"keyword_freq_{resolved_run_id}.csv", index=False)
+    keywords.to_csv(output_tables["keyword_freq"], index=False)
 
     derived_fields = ["pub_year", "author_names"]
     coverage = {
@@ -243,18 +242,12 @@ def run_clean(
         "derived_fields": derived_fields,
         "duplicates_removed": original_rows - deduped_rows,
         "coverage": coverage,
-        "output_tables": {
-            "pubs_by_year": str(analysis_dir / f"pubs_by_year_{resolved_run_id}.csv"),
-            "top_journals": str(analysis_dir / f"top_journals_{resolved_run_id}.csv"),
-            "top_authors": str(analysis_dir / f"top_authors_{resolved_run_id}.csv"),
-            "keyword_freq": str(analysis_dir / f"keyword_freq_{resolved_run_id}.csv"),
-        },
+        "output_tables": {name: str(path) for name, path in output_tables.items()},
         "notes": [],
     }
     if not keyword_col:
         manifest["notes"].append("Keyword column not found; keyword_freq is empty.")
     manifest_path = base_dir / "outputs" / "methods" / f"cleaning_manifest_{resolved_run_id}.json"
-    manifest_path.parent.mkdir(parents=True, exist_ok=True)
     write_json(manifest, manifest_path)
 
     logger.info("Wrote cleaned data to %s", cleaned_path["path"])
@@ -138,13 +138,12 @@ def build_parser() -> argparse.ArgumentParser:
 
 
 def main() -> None:
-    from pybibliometric_analysis.settings import generate_run_id
-
     parser = build_parser()
     args = parser.parse_args()
 
     if args.command == "extract":
         from pybibliometric_analysis.extract_scopus import run_extract
+        from pybibliometric_analysis.settings import generate_run_id
 
         run_id = args.run_id or generate_run_id()
         if args.run_id is None:
@@ -1,14 +1,23 @@
 from __future__ import annotations
 
 import logging
+import random
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
 from importlib import import_module
 from importlib.util import find_spec
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Iterable, List, Optional, Tuple
 
-from pybibliometric_analysis.io_utils import detect_parquet_support, write_json, write_table
+from pybibliometric_analysis.io_utils import (
+    detect_parquet_support,
+    setup_logger,
+    write_json,
+    write_table,
+)
 from pybibliometric_analysis.settings import (
     build_manifest,
     ensure_pybliometrics_cfg,
@@ -26,6 +35,12 @@ if TYPE_CHECKING:
 
 ScopusSearch = None
 
+_LOGGER = logging.getLogger("pybibliometric_analysis")
+
+# pybliometrics throttles through an unsynchronized module-level deque, so concurrent
+# searches could overrun the per-key rate limit; every search request is serialized.
+_SCOPUS_REQUEST_LOCK = threading.Lock()
+
 
 def _get_scopus_search_cls() -> Any:
     global ScopusSearch
@@ -242,23 +257,7 @@ def build_paths(base_dir: Path, run_id: str) -> ExtractPaths:
 
 
 def setup_logging(log_path: Path) -> logging.Logger:
-    log_path.parent.mkdir(parents=True, exist_ok=True)
-    logger = logging.getLogger("pybibliometric_analysis")
-    logger.setLevel(logging.INFO)
-
-    formatter = logging.Formatter("%(asctime)s %(levelname)s %(message)s")
-
-    file_handler = logging.FileHandler(log_path)
-    file_handler.setFormatter(formatter)
-
-    stream_handler = logging.StreamHandler()
-    stream_handler.setFormatter(formatter)
-
-    logger.handlers = []
-    logger.addHandler(file_handler)
-    logger.addHandler(stream_handler)
-
-    return logger
+    return setup_logger("pybibliometric_analysis", log_path)
 
 
 def run_standard(query: str, view: Optional[str], subscriber: bool) -> pd.DataFrame:
@@ -301,6 +300,7 @@ def run_slicing(
     end_year: Optional[int],
     max_years_back: Optional[int],
     subscriber: bool,
+    max_workers: int = 1,
 ) -> Tuple[pd.DataFrame, List[int]]:
     pd = _lazy_pandas()
     if start_year is None or end_year is None:
@@ -312,23 +312,41 @@ def run_slicing(
         end_year = current_year
         start_year = current_year - int(max_years_back) + 1
     years = list(range(int(start_year), int(end_year) + 1))
+    # Requests are serialized by _SCOPUS_REQUEST_LOCK, so extra workers only overlap the
+    # per-year result conversion; the default fetches one year at a time.
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(years)))) as executor:
+        year_frames = list(
+            executor.map(
+                lambda year: _fetch_year(query, year, view=view, subscriber=subscriber), years
+            )
+        )
     frames = []
     covered_years = []
-    for year in years:
-        year_query = f"{query} AND PUBYEAR = {year}"
-        precheck = retry_scopus_search(year_query, view=view, download=False, subscriber=subscriber)
-        if precheck.get_results_size() == 0:
+    seen_eids: set = set()
+    for year, frame in zip(years, year_frames):
+        if frame is None:
             continue
         covered_years.append(year)
-        results = retry_scopus_search(year_query, view=view, subscriber=subscriber)
-        frames.append(to_frame(results.results or []))
+        if "eid" in frame.columns:
+            eids = frame["eid"]
+            frame = frame[~(eids.isin(seen_eids) | eids.duplicated())]
+            seen_eids.update(frame["eid"])
+        frames.append(frame)
 
     combined = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
-    if not combined.empty and "eid" in combined.columns:
-        combined = combined.drop_duplicates(subset=["eid"])
     return combined, covered_years
 
 
+def _fetch_year(
+    query: str, year: int, *, view: Optional[str], subscriber: bool
+) -> Optional[pd.DataFrame]:
+    # The full fetch doubles as the coverage probe: an empty result means the year has no
+    # records, so a separate download=False size check would only add a round-trip.
+    results = retry_scopus_search(f"{query} AND PUBYEAR = {year}", view=view, subscriber=subscriber)
+    frame = to_frame(results.results or [])
+    return None if frame.empty else frame
+
+
 def retry_scopus_search(
     query: str,
     *,
@@ -336,26 +354,95 @@ def retry_scopus_search(
     download: bool = True,
     subscriber: bool = False,
     retries: int = 3,
-    delay: float = 2.0,
+    base_delay: float = 1.0,
+    max_delay: float = 30.0,
+    jitter: float = 0.5,
 ) -> Any:
     last_error: Optional[Exception] = None
     for attempt in range(retries):
         try:
             cls = _get_scopus_search_cls()
-            return cls(query, view=view, download=download, subscriber=subscriber)
+            with _SCOPUS_REQUEST_LOCK:
+                return cls(query, view=view, download=download, subscriber=subscriber)
         except Exception as exc:
-            _raise_actionable_scopus_error(exc)
-            last_error = exc
-            if attempt < retries - 1:
-                time.sleep(delay)
-            else:
+            if attempt >= retries - 1 or not _is_retryable_error(exc):
+                _raise_actionable_scopus_error(exc)
                 raise
+            last_error = exc
+            time.sleep(
+                _backoff_delay(
+                    exc, attempt, base_delay=base_delay, max_delay=max_delay, jitter=jitter
+                )
+            )
     raise RuntimeError("Scopus search failed") from last_error
 
 
+# Transient failures worth another attempt: rate limits, server errors and dropped
+# connections. Bad credentials or malformed queries fail the same way every time.
+_RETRYABLE_ERRORS = (
+    ("pybliometrics.exception", ("Scopus429Error", "ScopusServerError")),
+    ("pybliometrics.scopus.exception", ("Scopus429Error", "ScopusServerError")),
+    ("requests.exceptions", ("ConnectionError", "Timeout", "ChunkedEncodingError")),
+)
+
+
+@lru_cache(maxsize=1)
+def _retryable_exception_classes() -> Tuple[type, ...]:
+    classes: List[type] = [ConnectionError, TimeoutError]
+    for module_name, names in _RETRYABLE_ERRORS:
+        try:
+            module = import_module(module_name)
+        except ImportError:
+            continue
+        for name in names:
+            exc_cls = getattr(module, name, None)
+            if isinstance(exc_cls, type):
+                classes.append(exc_cls)
+    return tuple(classes)
+
+
+def _is_retryable_error(exc: Exception) -> bool:
+    if isinstance(exc, _retryable_exception_classes()):
+        return True
+    status_code = getattr(exc, "status_code", None)
+    if status_code is None:
+        status_code = getattr(getattr(exc, "response", None), "status_code", None)
+    if isinstance(status_code, int):
+        return status_code == 429 or status_code >= 500
+    return _retry_after_seconds(exc) is not None
+
+
+def _retry_after_seconds(exc: Exception) -> Optional[float]:
+    response = getattr(exc, "response", None)
+    headers = getattr(response, "headers", None) or {}
+    try:
+        return max(0.0, float(headers["Retry-After"]))
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def _backoff_delay(
+    exc: Exception,
+    attempt: int,
+    *,
+    base_delay: float,
+    max_delay: float,
+    jitter: float,
+) -> float:
+    retry_after = _retry_after_seconds(exc)
+    if retry_after is not None:
+        return min(max_delay, retry_after)
+    return min(max_delay, base_delay * (2**attempt)) * (1 + random.uniform(0, jitter))
+
+
 def to_frame(records: Iterable[object]) -> pd.DataFrame:
     pd = _lazy_pandas()
-    logger = logging.getLogger("pybibliometric_analysis")
+    records = list(records)
+    record_type = type(records[0]) if records else None
+    if hasattr(record_type, "_fields") and all(type(r) is record_type for r in records):
+        # pybliometrics yields one namedtuple type per search; its rows are already tuples,
+        # so they can be loaded without an _asdict() copy per record.
+        return pd.DataFrame.from_records(records, columns=list(record_type._fields))
     rows = []
     for record in records:
         if hasattr(record, "_asdict"):
@@ -363,36 +450,56 @@ def to_frame(records: Iterable[object]) -> pd.DataFrame:
         elif isinstance(record, dict):
             rows.append(record)
         else:
-            logger.warning("Unexpected record type %s; passing through to pandas", type(record))
+            _LOGGER.warning("Unexpected record type %s; passing through to pandas", type(record))
             rows.append(record)
     return pd.DataFrame(rows)
 
 
+_ACTIONABLE_SCOPUS_ERRORS = {
+    "Scopus401Error": "Unauthorized (401): SCOPUS_API_KEY is invalid or disabled.",
+    "Scopus403Error": (
+        "Forbidden (403): access requires INST_TOKEN or an institutional subscription."
+    ),
+    "Scopus429Error": "Rate limited: too many requests; reduce request rate or retry later.",
+}
+
+
+@lru_cache(maxsize=1)
+def _actionable_exception_classes() -> Tuple[Tuple[type, str], ...]:
+    # Resolved once: find_spec hits the filesystem and this runs on every failed attempt.
+    # pybliometrics 4.x moved the exceptions from pybliometrics.scopus.exception to
+    # pybliometrics.exception.
+    for module_name in ("pybliometrics.exception", "pybliometrics.scopus.exception"):
+        try:
+            if not find_spec(module_name):
+                continue
+        except ModuleNotFoundError:
+            continue
+        exc_mod = import_module(module_name)
+        classes = []
+        for name, message in _ACTIONABLE_SCOPUS_ERRORS.items():
+            exc_cls = getattr(exc_mod, name, None)
+            if isinstance(exc_cls, type):
+                classes.append((exc_cls, message))
+        return tuple(classes)
+    return ()
+
+
 def _raise_actionable_scopus_error(exc: Exception) -> None:
     error_name = exc.__class__.__name__
-    actionable = {
-        "Scopus401Error": "Unauthorized (401): SCOPUS_API_KEY is invalid or disabled.",
-        "Scopus403Error": (
-            "Forbidden (403): access requires INST_TOKEN or an institutional subscription."
-        ),
-        "Scopus429Error": "Rate limited: too many requests; reduce request rate or retry later.",
-    }
-    if error_name in actionable:
-        raise RuntimeError(actionable[error_name]) from exc
+    if error_name in _ACTIONABLE_SCOPUS_ERRORS:
+        raise RuntimeError(_ACTIONABLE_SCOPUS_ERRORS[error_name]) from exc
 
     if hasattr(exc, "status_code"):
         status_code = getattr(exc, "status_code")
         if status_code in {401, 403, 429}:
             raise RuntimeError(
-                actionable.get(f"Scopus{status_code}Error", "Scopus API error.")
+                _ACTIONABLE_SCOPUS_ERRORS.get(f"Scopus{status_code}Error", "Scopus API error.")
             ) from exc
 
-    if find_spec("pybliometrics.scopus.exception"):
-        exc_mod = import_module("pybliometrics.scopus.exception")
-        for name, message in actionable.items():
-            exc_cls = getattr(exc_mod, name, None)
-            if exc_cls and isinstance(exc, exc_cls):
-                raise RuntimeError(message) from exc
+    for exc_cls, message in _actionable_exception_classes():
+        if isinstance(exc, exc_cls):
+            raise RuntimeError(message) from exc
 
 
 def _expected_raw_path(raw_base: Path) -> Path:
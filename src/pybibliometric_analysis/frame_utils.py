@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from pybibliometric_analysis.io_utils import detect_parquet_support
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+_BINCOUNT_MAX_SPAN = 10_000
+
+
+def _lazy_pandas():
+    import pandas as pd
+
+    return pd
+
+
+def string_dtype() -> str:
+    return "string[pyarrow]" if detect_parquet_support() else "string"
+
+
+def cover_years(values: "pd.Series") -> "pd.Series":
+    """Leading ``YYYY`` of each cover date; anything else becomes NaN."""
+    pd = _lazy_pandas()
+    leading = values.astype(string_dtype()).str.strip().str.extract(r"^(\d{4})", expand=False)
+    return pd.to_numeric(leading, errors="coerce").astype("float64")
+
+
+def count_by_year(years: "pd.Series") -> "pd.DataFrame":
+    import numpy as np
+
+    pd = _lazy_pandas()
+    years = years.dropna()
+    values = years.to_numpy(dtype=np.float64)
+    integral = values.size and np.array_equal(values, np.floor(values))
+    if integral and values.max() - values.min() < _BINCOUNT_MAX_SPAN:
+        # Years span a small integer range, so a dense histogram beats a hash group-by.
+        # A malformed outlier (e.g. 20200101) would blow up the histogram, hence the cap.
+        offset = int(values.min())
+        counts = np.bincount((values - offset).astype(np.int64))
+        present = np.flatnonzero(counts)
+        keys, counts = present + offset, counts[present]
+    else:
+        keys, counts = np.unique(values, return_counts=True)
+    return pd.DataFrame(
+        {"pub_year": pd.Series(keys, dtype=years.dtype), "count": counts.astype(np.int64)}
+    )
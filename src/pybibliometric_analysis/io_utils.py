@@ -2,13 +2,26 @@ from __future__ import annotations
 
 import json
 import logging
+import math
+import os
+from functools import lru_cache
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, List, Optional
 
 if TYPE_CHECKING:
     import pandas as pd
 
+# Forwarded by ``DataFrame.to_parquet`` to ``pyarrow.parquet.write_table``. Scopus tables are
+# dominated by repeated strings (journals, document types, keywords), which dictionary
+# encoding collapses before ZSTD compresses the pages.
+_PARQUET_WRITE_OPTIONS = {"compression": "zstd", "compression_level": 3, "use_dictionary": True}
 
+_LOG_FORMAT = "%(asctime)s %(levelname)s %(message)s"
+
+_LOGGER = logging.getLogger("pybibliometric_analysis")
+
+
+@lru_cache(maxsize=1)
 def detect_parquet_support() -> bool:
     try:
         import pyarrow  # noqa: F401
@@ -25,6 +38,32 @@ def ensure_parent_dir(path: Path) -> None:
     ensure_dir(path.parent)
 
 
+def setup_logger(name: str, log_path: Path) -> logging.Logger:
+    ensure_parent_dir(log_path)
+    logger = logging.getLogger(name)
+    logger.setLevel(logging.INFO)
+
+    target = os.path.abspath(log_path)
+    if any(
+        isinstance(handler, logging.FileHandler) and handler.baseFilename == target
+        for handler in logger.handlers
+    ):
+        return logger
+
+    for handler in logger.handlers:
+        handler.close()
+
+    formatter = logging.Formatter(_LOG_FORMAT)
+    file_handler = logging.FileHandler(log_path, delay=True)
+    file_handler.setFormatter(formatter)
+
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(formatter)
+
+    logger.handlers = [file_handler, stream_handler]
+    return logger
+
+
 def _lazy_pandas():
     import pandas as pd
 
@@ -32,7 +71,6 @@ def _lazy_pandas():
 
 
 def write_table(df: "pd.DataFrame", path_base: Path, prefer_parquet: bool = True) -> dict:
-    logger = logging.getLogger("pybibliometric_analysis")
     forced_suffix = path_base.suffix if path_base.suffix in {".parquet", ".csv"} else None
     base = _normalize_base_path(path_base)
     ensure_parent_dir(base)
@@ -44,39 +82,52 @@ def write_table(df: "pd.DataFrame", path_base: Path, prefer_parquet: bool = True
 
     if not prefer_parquet or not detect_parquet_support():
         csv_path = base.with_suffix(".csv")
-        logger.warning("Parquet engine unavailable; wrote CSV instead: %s", csv_path)
+        _LOGGER.warning("Parquet engine unavailable; wrote CSV instead: %s", csv_path)
         df.to_csv(csv_path, index=False)
         return {"path": str(csv_path), "format": "csv"}
 
+    parquet_path = base.with_suffix(".parquet")
     try:
-        parquet_path = base.with_suffix(".parquet")
-        df.to_parquet(parquet_path, index=False, engine="pyarrow")
+        df.to_parquet(parquet_path, index=False, engine="pyarrow", **_PARQUET_WRITE_OPTIONS)
         return {"path": str(parquet_path), "format": "parquet"}
-    except (ImportError, ValueError, AttributeError) as exc:
+    except _parquet_write_errors() as exc:
+        # A half-written file would shadow the CSV in read_table, which prefers Parquet.
+        parquet_path.unlink(missing_ok=True)
         csv_path = base.with_suffix(".csv")
-        logger.warning(
+        _LOGGER.warning(
             "Parquet write failed (%s). Wrote CSV instead: %s", exc.__class__.__name__, csv_path
         )
         df.to_csv(csv_path, index=False)
         return {"path": str(csv_path), "format": "csv"}
 
 
-def read_table(path_base: Path) -> "pd.DataFrame":
+@lru_cache(maxsize=1)
+def _parquet_write_errors() -> tuple:
+    # Mixed-type object columns raise ArrowTypeError (a TypeError); a pyarrow build without
+    # the zstd codec raises ArrowNotImplementedError. Both fall back to CSV.
+    errors = (ImportError, ValueError, AttributeError, TypeError)
+    try:
+        from pyarrow.lib import ArrowException
+    except ImportError:
+        return errors
+    return errors + (ArrowException,)
+
+
+def read_table(path_base: Path, columns: Optional[List[str]] = None) -> "pd.DataFrame":
     pd = _lazy_pandas()
-    logger = logging.getLogger("pybibliometric_analysis")
     path = _normalize_base_path(path_base)
 
     if path.suffix == ".csv" and path.exists():
-        return pd.read_csv(path)
+        return pd.read_csv(path, usecols=columns)
 
     if path.suffix == ".parquet" and path.exists():
         if not detect_parquet_support():
             csv_path = path.with_suffix(".csv")
             if csv_path.exists():
-                logger.warning("Parquet engine unavailable; reading CSV instead: %s", csv_path)
-                return pd.read_csv(csv_path)
+                _LOGGER.warning("Parquet engine unavailable; reading CSV instead: %s", csv_path)
+                return pd.read_csv(csv_path, usecols=columns)
             raise RuntimeError("Parquet engine unavailable and no CSV fallback found.")
-        return pd.read_parquet(path, engine="pyarrow")
+        return pd.read_parquet(path, engine="pyarrow", columns=columns, use_threads=True)
 
     if path.suffix:
         raise FileNotFoundError(f"File not found: {path}")
@@ -85,20 +136,46 @@ def read_table(path_base: Path) -> "pd.DataFrame":
     csv_path = path.with_suffix(".csv")
     if parquet_path.exists():
         if not detect_parquet_support() and csv_path.exists():
-            logger.warning("Parquet engine unavailable; reading CSV instead: %s", csv_path)
-            return pd.read_csv(csv_path)
+            _LOGGER.warning("Parquet engine unavailable; reading CSV instead: %s", csv_path)
+            return pd.read_csv(csv_path, usecols=columns)
         if not detect_parquet_support():
             raise RuntimeError("Parquet engine unavailable and no CSV fallback found.")
-        return pd.read_parquet(parquet_path, engine="pyarrow")
+        return pd.read_parquet(parquet_path, engine="pyarrow", columns=columns, use_threads=True)
     if csv_path.exists():
-        return pd.read_csv(csv_path)
+        return pd.read_csv(csv_path, usecols=columns)
 
     raise FileNotFoundError(f"No parquet/csv file found for base path: {path}")
 
 
+def _dumps_json(data: Any) -> bytes:
+    try:
+        import orjson
+    except ImportError:
+        orjson = None
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+        except TypeError:
+            pass
+    # Match orjson's output: raw UTF-8 rather than \u escapes, and NaN/inf as null.
+    return json.dumps(
+        _finite_or_none(data), indent=2, sort_keys=True, ensure_ascii=False
+    ).encode("utf-8")
+
+
+def _finite_or_none(data: Any) -> Any:
+    if isinstance(data, float):
+        return data if math.isfinite(data) else None
+    if isinstance(data, dict):
+        return {key: _finite_or_none(value) for key, value in data.items()}
+    if isinstance(data, (list, tuple)):
+        return [_finite_or_none(value) for value in data]
+    return data
+
+
 def write_json(data: Any, path: Path) -> None:
     ensure_parent_dir(path)
-    path.write_text(json.dumps(data, indent=2, sort_keys=True), encoding="utf-8")
+    path.write_bytes(_dumps_json(data))
 
 
 def read_json(path: Path) -> Any:
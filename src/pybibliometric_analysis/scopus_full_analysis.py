@@ -1,63 +1,118 @@
 from __future__ import annotations
 
-import json
 import logging
-import re
-import shutil
-from collections import Counter
+import os
+import zipfile
 from datetime import datetime
+from itertools import chain
 from pathlib import Path
 from typing import Optional
 
 import numpy as np
 import pandas as pd
 
+from pybibliometric_analysis.frame_utils import cover_years, string_dtype
+from pybibliometric_analysis.io_utils import (
+    detect_parquet_support,
+    setup_logger,
+    write_json,
+    write_table,
+)
+
+_COUNTRY_REGION: dict[str, str] = {
+    "united states": "North America",
+    "canada": "North America",
+    "united kingdom": "Europe & Central Asia",
+    "italy": "Europe & Central Asia",
+    "france": "Europe & Central Asia",
+    "germany": "Europe & Central Asia",
+    "spain": "Europe & Central Asia",
+    "turkey": "Europe & Central Asia",
+    "saudi arabia": "Middle East & North Africa",
+    "united arab emirates": "Middle East & North Africa",
+    "qatar": "Middle East & North Africa",
+    "iran": "Middle East & North Africa",
+    "iran, islamic republic of": "Middle East & North Africa",
+    "egypt": "Middle East & North Africa",
+    "pakistan": "South Asia",
+    "india": "South Asia",
+    "bangladesh": "South Asia",
+    "china": "East Asia & Pacific",
+    "japan": "East Asia & Pacific",
+    "malaysia": "East Asia & Pacific",
+    "indonesia": "East Asia & Pacific",
+    "singapore": "East Asia & Pacific",
+    "australia": "East Asia & Pacific",
+    "nigeria": "Sub-Saharan Africa",
+    "south africa": "Sub-Saharan Africa",
+    "brazil": "Latin America & Caribbean",
+    "mexico": "Latin America & Caribbean",
+}
+
+_COUNTRY_ALIASES: dict[str, str] = {
+    "usa": "united states",
+    "us": "united states",
+    "uk": "united kingdom",
+    "uae": "united arab emirates",
+    "viet nam": "vietnam",
+}
+
+# Python's ``\s`` spelled out as a character class, so Arrow's RE2 engine (whose ``\s`` is
+# ASCII-only) collapses the same Unicode whitespace as ``re`` does.
+_WHITESPACE_RUN = "[\t-\r\x1c-\x1f \x85\xa0\u1680\u2000-\u200a\u2028\u2029\u202f\u205f\u3000]+"
+
+_ZIP_DEFLATE_SUFFIXES = {".csv", ".html", ".json", ".log", ".txt"}
+
 
 def setup_logging(log_path: Path) -> logging.Logger:
-    log_path.parent.mkdir(parents=True, exist_ok=True)
-    logger = logging.getLogger("pybibliometric_analysis.full_analysis")
-    logger.setLevel(logging.INFO)
-    formatter = logging.Formatter("%(asctime)s %(levelname)s %(message)s")
+    return setup_logger("pybibliometric_analysis.full_analysis", log_path)
+
+
+def _norm_text(series: pd.Series) -> pd.Series:
+    """Trim, lower-case and collapse whitespace column-wise; missing values become ``""``."""
+    return (
+        series.astype(string_dtype())
+        .fillna("")
+        .str.strip()
+        .str.lower()
+        .str.replace(_WHITESPACE_RUN, " ", regex=True)
+    )
 
-    logger.handlers = []
-    fh = logging.FileHandler(log_path)
-    fh.setFormatter(formatter)
-    logger.addHandler(fh)
 
-    sh = logging.StreamHandler()
-    sh.setFormatter(formatter)
-    logger.addHandler(sh)
-    return logger
+def _split_keywords(series: pd.Series) -> pd.Series:
+    """Explode ``;``-separated cells into one normalized keyword per row, keeping the index."""
+    keywords = _norm_text(series.fillna("").astype(str).str.split(";").explode())
+    return keywords[keywords != ""]
 
 
-def _norm_text(value: object) -> str:
-    if pd.isna(value):
-        return ""
-    text = str(value).strip().lower()
-    text = re.sub(r"\s+", " ", text)
-    return text
+def _first_author(series: pd.Series) -> pd.Series:
+    return _norm_text(series.fillna("").astype(str).str.split(";", n=1).str[0])
 
 
-def _split_keywords(value: object) -> list[str]:
-    if pd.isna(value):
-        return []
-    return [_norm_text(part) for part in str(value).split(";") if _norm_text(part)]
+def _keyword_lists(keyword_items: list[pd.Series], index: pd.Index) -> pd.Series:
+    """Collect each document's distinct keywords as a sorted list aligned to ``index``."""
+    by_doc: dict = {}
+    if keyword_items:
+        items = pd.concat(keyword_items)
+        pairs = pd.DataFrame({"doc": items.index, "keyword": items.to_numpy()})
+        pairs = pairs.drop_duplicates().sort_values("keyword", kind="stable")
+        by_doc = pairs.groupby("doc", sort=False)["keyword"].agg(list).to_dict()
+    return pd.Series([by_doc.get(doc, []) for doc in index], index=index, dtype=object)
 
 
-def _first_author(authors: object) -> str:
-    if pd.isna(authors):
-        return ""
-    text = str(authors).strip()
-    if not text:
-        return ""
-    return _norm_text(text.split(";")[0])
+def _read_scopus_csv(csv_path: Path) -> pd.DataFrame:
+    # pyarrow's multithreaded parser is several times faster on large exports; the C
+    # parser remains the fallback when pyarrow is missing or rejects the file.
+    if detect_parquet_support():
+        try:
+            return pd.read_csv(csv_path, engine="pyarrow")
+        except ValueError:
+            pass
+    return pd.read_csv(csv_path)
 
 
-def _coalesce_col(df: pd.DataFrame, candidates: list[str]) -> Optional[str]:
-    for candidate in candidates:
-        if candidate in df.columns:
-            return candidate
-    return None
+def _coalesce_col(columns: set[str], candidates: list[str]) -> Optional[str]:
+    return next((candidate for candidate in candidates if candidate in columns), None)
 
 
 def _top_counts(series: pd.Series, n: int = 25, out_col: str = "value") -> pd.DataFrame:
@@ -70,6 +125,47 @@ def _top_counts(series: pd.Series, n: int = 25, out_col: str = "value") -> pd.Da
     return out
 
 
+def _keyword_pair_counts(keyword_lists: pd.Series, min_count: int = 5) -> pd.DataFrame:
+    """Count per-document keyword co-occurrences as a ``from``/``to``/``value`` edge table.
+
+    Only keywords appearing in at least ``min_count`` documents are kept. Keywords are
+    integer-encoded in a single ``np.unique`` pass and each document's codes are laid out
+    contiguously (CSR-style), so every pair is generated and counted with NumPy ops.
+    """
+    lengths = keyword_lists.map(len).to_numpy(dtype=np.int64)
+    flat = np.fromiter(chain.from_iterable(keyword_lists), dtype=object, count=int(lengths.sum()))
+    names, codes, freq = np.unique(flat, return_inverse=True, return_counts=True)
+    doc_ids = np.repeat(np.arange(len(lengths)), lengths)
+
+    keep = (freq >= min_count)[codes]
+    codes, doc_ids = codes[keep], doc_ids[keep]
+    order = np.lexsort((codes, doc_ids))
+    codes, doc_ids = codes[order], doc_ids[order]
+    distinct = np.ones(len(codes), dtype=bool)
+    distinct[1:] = (np.diff(doc_ids) != 0) | (np.diff(codes) != 0)
+    codes, doc_ids = codes[distinct], doc_ids[distinct]
+    lengths = np.bincount(doc_ids, minlength=len(lengths))
+
+    # Each code pairs with every code after it in the same document.
+    positions = np.arange(len(codes))
+    partners = np.repeat(np.cumsum(lengths), lengths) - positions - 1
+    n_pairs = int(partners.sum())
+    if n_pairs == 0:
+        return pd.DataFrame(columns=["from", "to", "value"])
+    left = np.repeat(positions, partners)
+    offsets = np.arange(n_pairs) - np.repeat(np.cumsum(partners) - partners, partners)
+    right = left + 1 + offsets
+
+    pair_keys, counts = np.unique(codes[left] * len(names) + codes[right], return_counts=True)
+    return pd.DataFrame(
+        {
+            "from": names[pair_keys // len(names)],
+            "to": names[pair_keys % len(names)],
+            "value": counts,
+        }
+    )
+
+
 def _build_plotly_figure_exports(fig: object, output_base: Path) -> None:
     output_base.parent.mkdir(parents=True, exist_ok=True)
     try:
@@ -83,59 +179,46 @@ def _build_plotly_figure_exports(fig: object, output_base: Path) -> None:
             return
 
 
-def _compute_region(country: str) -> str:
-    country_map = {
-        "united states": "North America",
-        "canada": "North America",
-        "united kingdom": "Europe & Central Asia",
-        "italy": "Europe & Central Asia",
-        "france": "Europe & Central Asia",
-        "germany": "Europe & Central Asia",
-        "spain": "Europe & Central Asia",
-        "turkey": "Europe & Central Asia",
-        "saudi arabia": "Middle East & North Africa",
-        "united arab emirates": "Middle East & North Africa",
-        "qatar": "Middle East & North Africa",
-        "iran": "Middle East & North Africa",
-        "iran, islamic republic of": "Middle East & North Africa",
-        "egypt": "Middle East & North Africa",
-        "pakistan": "South Asia",
-        "india": "South Asia",
-        "bangladesh": "South Asia",
-        "china": "East Asia & Pacific",
-        "japan": "East Asia & Pacific",
-        "malaysia": "East Asia & Pacific",
-        "indonesia": "East Asia & Pacific",
-        "singapore": "East Asia & Pacific",
-        "australia": "East Asia & Pacific",
-        "nigeria": "Sub-Saharan Africa",
-        "south africa": "Sub-Saharan Africa",
-        "brazil": "Latin America & Caribbean",
-        "mexico": "Latin America & Caribbean",
-    }
-    return country_map.get(country.strip().lower(), "Unknown")
-
-
-def _extract_countries(affiliations: object) -> set[str]:
-    if pd.isna(affiliations):
-        return set()
-    aliases = {
-        "usa": "united states",
-        "us": "united states",
-        "uk": "united kingdom",
-        "uae": "united arab emirates",
-        "viet nam": "vietnam",
-    }
-    countries = set()
-    for segment in str(affiliations).split(";"):
-        segment = segment.strip()
-        if not segment:
-            continue
-        token = segment.split(",")[-1].strip().lower()
-        token = aliases.get(token, token)
-        if token:
-            countries.add(token)
-    return countries
+def _extract_countries(affiliations: pd.Series) -> pd.Series:
+    """Return one row per distinct country in each ``;``-separated affiliation cell.
+
+    The country is the last comma-separated token of each affiliation; the result keeps
+    the document index, so a document appears once per country it mentions.
+    """
+    segments = affiliations.dropna().astype(str).str.split(";").explode().str.strip()
+    segments = segments[segments != ""]
+    countries = segments.str.split(",").str[-1].str.strip().str.lower()
+    countries = countries.replace(_COUNTRY_ALIASES)
+    countries = countries[countries != ""]
+    pairs = pd.DataFrame({"doc": countries.index, "country": countries.to_numpy()})
+    return countries[~pairs.duplicated().to_numpy()]
+
+
+def _zip_output_tree(output_root: Path) -> Path:
+    """Zip ``output_root`` next to itself, deflating only text files.
+
+    PNG figures and Parquet tables are already compressed, so they are stored as-is
+    rather than run through DEFLATE a second time.
+    """
+    archive_path = output_root.with_name(f"{output_root.name}.zip")
+    with zipfile.ZipFile(archive_path, "w") as archive:
+        for dirpath, dirnames, filenames in os.walk(output_root):
+            dirnames.sort()
+            for name in dirnames:
+                # Keep empty figure/network folders in the archive, as make_archive did.
+                path = Path(dirpath) / name
+                archive.write(path, arcname=path.relative_to(output_root))
+            for name in sorted(filenames):
+                path = Path(dirpath) / name
+                compression = (
+                    zipfile.ZIP_DEFLATED
+                    if path.suffix.lower() in _ZIP_DEFLATE_SUFFIXES
+                    else zipfile.ZIP_STORED
+                )
+                archive.write(
+                    path, arcname=path.relative_to(output_root), compress_type=compression
+                )
+    return archive_path
 
 
 def run_full_scopus_csv_analysis(
@@ -160,52 +243,61 @@ def run_full_scopus_csv_analysis(
 
     logger = setup_logging(base_dir / "logs" / f"full_analysis_{run_id}.log")
 
-    df = pd.read_csv(csv_path)
+    df = _read_scopus_csv(csv_path)
     df.columns = [c.strip() for c in df.columns]
 
-    col_year = _coalesce_col(df, ["Year", "pub_year"])
-    col_title = _coalesce_col(df, ["Title", "dc:title", "title"])
+    columns = set(df.columns)
+    col_year = _coalesce_col(columns, ["Year", "pub_year"])
+    col_title = _coalesce_col(columns, ["Title", "dc:title", "title"])
     if not col_year:
-        col_year = _coalesce_col(df, ["coverDate", "cover_date"])
+        col_year = _coalesce_col(columns, ["coverDate", "cover_date"])
     if not col_year:
         raise ValueError("CSV must include a Year (or coverDate/cover_date) column.")
 
-    col_eid = _coalesce_col(df, ["EID", "eid"])
-    col_doi = _coalesce_col(df, ["DOI", "doi"])
-    col_authors = _coalesce_col(df, ["Authors", "author_names", "dc:creator", "creator"])
-    col_source = _coalesce_col(df, ["Source title", "prism:publicationName", "publicationName"])
-    col_doctype = _coalesce_col(df, ["Document Type", "subtypeDescription"])
-    col_ak = _coalesce_col(df, ["Author Keywords", "authkeywords", "author_keywords"])
-    col_ik = _coalesce_col(df, ["Index Keywords", "idxterms"])
-    col_affils = _coalesce_col(df, ["Affiliations", "affilname"])
+    col_eid = _coalesce_col(columns, ["EID", "eid"])
+    col_doi = _coalesce_col(columns, ["DOI", "doi"])
+    col_authors = _coalesce_col(columns, ["Authors", "author_names", "dc:creator", "creator"])
+    col_source = _coalesce_col(
+        columns, ["Source title", "prism:publicationName", "publicationName"]
+    )
+    col_doctype = _coalesce_col(columns, ["Document Type", "subtypeDescription"])
+    col_ak = _coalesce_col(columns, ["Author Keywords", "authkeywords", "author_keywords"])
+    col_ik = _coalesce_col(columns, ["Index Keywords", "idxterms"])
+    col_affils = _coalesce_col(columns, ["Affiliations", "affilname"])
 
-    df["_year"] = pd.to_numeric(df[col_year], errors="coerce")
+    if col_year in ("coverDate", "cover_date"):
+        df["_year"] = cover_years(df[col_year])
+    else:
+        df["_year"] = pd.to_numeric(df[col_year], errors="coerce")
     df = df[df["_year"].notna()].copy()
-    df["_year"] = df["_year"].astype(int)
+    # int16 is enough for real years; a malformed value outside its range would wrap
+    # around (67556 -> 2020), so such columns keep the full int64 width instead.
+    fits_int16 = df["_year"].between(np.iinfo(np.int16).min, np.iinfo(np.int16).max).all()
+    df["_year"] = df["_year"].astype("int16" if fits_int16 else "int64")
 
     df["_eid"] = df[col_eid].fillna("").astype(str).str.strip() if col_eid else ""
     df["_doi"] = (
         df[col_doi].fillna("").astype(str).str.strip().str.lower() if col_doi else ""
     )
     if col_title:
-        df["_t"] = df[col_title].map(_norm_text)
+        df["_t"] = _norm_text(df[col_title])
     else:
         df["_t"] = ""
-    df["_a1"] = df[col_authors].map(_first_author) if col_authors else ""
-
-    def make_key(row: pd.Series) -> str:
-        if row["_eid"]:
-            return f"EID:{row['_eid']}"
-        if row["_doi"]:
-            return f"DOI:{row['_doi']}"
-        return f"FALL:{row['_t']}|{row['_year']}|{row['_a1']}"
+    df["_a1"] = _first_author(df[col_authors]) if col_authors else ""
 
     n_raw = len(df)
-    df["_dedup_key"] = df.apply(make_key, axis=1)
-    df_clean = df.drop_duplicates(subset=["_dedup_key"]).copy()
+    # Prefer EID, then DOI, then a title|year|first-author fallback, column-wise.
+    key_parts = [df[col].astype(string_dtype()) for col in ("_t", "_year", "_a1")]
+    fallback_key = "FALL:" + key_parts[0] + "|" + key_parts[1] + "|" + key_parts[2]
+    df["_dedup_key"] = ("EID:" + df["_eid"]).where(
+        df["_eid"] != "", ("DOI:" + df["_doi"]).where(df["_doi"] != "", fallback_key)
+    )
+    df_clean = df.drop_duplicates(subset=["_dedup_key"])
 
-    scoped = df_clean[(df_clean["_year"] >= min_year) & (df_clean["_year"] <= max_year)].copy()
-    scoped.to_csv(table_dir / "dataset_scope.csv", index=False)
+    # Both frames are only read from here on, so the filtered views are not copied.
+    scoped = df_clean[(df_clean["_year"] >= min_year) & (df_clean["_year"] <= max_year)]
+    # The scoped dataset is the one wide table here; the summaries stay CSV for readers.
+    scope_output = write_table(scoped, table_dir / "dataset_scope")
 
     pubs_by_year = (
         scoped.groupby("_year")
@@ -216,7 +308,12 @@ def run_full_scopus_csv_analysis(
     )
     pubs_by_year = pubs_by_year.sort_values("year")
     pubs_by_year["yoy_pct"] = pubs_by_year["n_pubs"].pct_change() * 100.0
-    pubs_by_year["ma3"] = pubs_by_year["n_pubs"].rolling(3).mean()
+    n_pubs = pubs_by_year["n_pubs"].to_numpy(dtype=np.float64)
+    ma3 = np.full(n_pubs.shape, np.nan)
+    if n_pubs.size >= 3:
+        # Sum the window first, then divide once: the same rounding as rolling(3).mean().
+        ma3[2:] = (n_pubs[:-2] + n_pubs[1:-1] + n_pubs[2:]) / 3.0
+    pubs_by_year["ma3"] = ma3
     pubs_by_year.to_csv(table_dir / "pubs_by_year.csv", index=False)
 
     cagr = np.nan
@@ -246,49 +343,42 @@ def run_full_scopus_csv_analysis(
         )
         author_counts.to_csv(table_dir / "top_authors.csv", index=False)
 
-    keyword_lists = pd.Series([[]] * len(scoped), index=scoped.index)
-    if col_ak:
-        keyword_lists = keyword_lists + scoped[col_ak].map(_split_keywords)
-    if col_ik:
-        keyword_lists = keyword_lists + scoped[col_ik].map(_split_keywords)
-    keyword_lists = keyword_lists.map(lambda kws: sorted(set(kws)))
+    keyword_lists = _keyword_lists(
+        [_split_keywords(scoped[col]) for col in (col_ak, col_ik) if col], scoped.index
+    )
 
-    keyword_freq = keyword_lists.explode().dropna()
-    keyword_freq = keyword_freq[keyword_freq != ""].value_counts().reset_index()
-    keyword_freq.columns = ["keyword", "count"]
+    # _split_keywords already drops empty keywords; dropna only removes keyword-less docs.
+    keyword_freq = (
+        keyword_lists.explode()
+        .dropna()
+        .value_counts()
+        .rename_axis("keyword")
+        .reset_index(name="count")
+    )
     keyword_freq.to_csv(table_dir / "keyword_freq.csv", index=False)
 
     # Geographical bubble aggregation (2002-2025 bins)
     bins = ["2002-2006", "2007-2011", "2012-2016", "2017-2021", "2022-2025"]
 
-    def year_to_bin(year: int) -> Optional[str]:
-        if 2002 <= year <= 2006:
-            return bins[0]
-        if 2007 <= year <= 2011:
-            return bins[1]
-        if 2012 <= year <= 2016:
-            return bins[2]
-        if 2017 <= year <= 2021:
-            return bins[3]
-        if 2022 <= year <= 2025:
-            return bins[4]
-        return None
-
-    geo_rows = []
+    geo_table = pd.DataFrame(columns=["bin", "region", "N_pub"])
     if col_affils:
-        bubble_df = df_clean[(df_clean["_year"] >= 2002) & (df_clean["_year"] <= 2025)].copy()
-        for _, row in bubble_df.iterrows():
-            b = year_to_bin(int(row["_year"]))
-            if not b:
-                continue
-            countries = _extract_countries(row[col_affils])
-            if not countries:
-                continue
-            weight = 1 / len(countries)
-            for country in countries:
-                geo_rows.append({"bin": b, "region": _compute_region(country), "N_pub": weight})
-
-    geo_table = pd.DataFrame(geo_rows)
+        bubble_df = df_clean[(df_clean["_year"] >= 2002) & (df_clean["_year"] <= 2025)]
+        countries = _extract_countries(bubble_df[col_affils])
+        # Each document's unit weight is split evenly across the countries it names.
+        weights = 1 / countries.groupby(level=0).transform("size")
+        year_bins = pd.cut(
+            bubble_df["_year"].reindex(countries.index),
+            bins=[2001, 2006, 2011, 2016, 2021, 2025],
+            labels=bins,
+        )
+        geo_table = pd.DataFrame(
+            {
+                "bin": year_bins.astype(str).to_numpy(),
+                "region": countries.map(_COUNTRY_REGION).fillna("Unknown").to_numpy(),
+                "N_pub": weights.to_numpy(dtype=np.float64),
+            }
+        )
+
     if not geo_table.empty:
         geo_agg = geo_table.groupby(["bin", "region"], as_index=False)["N_pub"].sum()
         geo_agg.to_csv(table_dir / "bubble_regions_over_time.csv", index=False)
@@ -353,21 +443,10 @@ def run_full_scopus_csv_analysis(
         import networkx as nx
         from pyvis.network import Network
 
-        if keyword_freq.empty:
-            valid_keywords: set[str] = set()
-        else:
-            valid_keywords = set(keyword_freq[keyword_freq["count"] >= 5]["keyword"])
-        edge_counts: Counter[tuple[str, str]] = Counter()
-        for kws in keyword_lists:
-            kws = sorted(set(k for k in kws if k in valid_keywords))
-            for i in range(len(kws)):
-                for j in range(i + 1, len(kws)):
-                    edge_counts[(kws[i], kws[j])] += 1
-
-        if edge_counts:
-            edges = pd.DataFrame(
-                [{"from": a, "to": b, "value": w} for (a, b), w in edge_counts.items()]
-            ).sort_values("value", ascending=False).head(400)
+        edge_counts = _keyword_pair_counts(keyword_lists, min_count=5)
+
+        if not edge_counts.empty:
+            edges = edge_counts.sort_values("value", ascending=False).head(400)
             graph = nx.from_pandas_edgelist(edges, "from", "to", "value")
             net = Network(height="800px", width="100%", bgcolor="white", font_color="black")
             net.from_nx(graph)
@@ -383,9 +462,10 @@ def run_full_scopus_csv_analysis(
         "rows_raw": n_raw,
         "rows_deduplicated": int(len(df_clean)),
         "rows_scoped": int(len(scoped)),
+        "dataset_scope": scope_output,
         "year_scope": {"min_year": min_year, "max_year": max_year},
     }
-    (meta_dir / "manifest.json").write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+    write_json(manifest, meta_dir / "manifest.json")
 
-    archive_path = shutil.make_archive(str(output_root), "zip", str(output_root))
+    archive_path = _zip_output_tree(output_root)
     logger.info("Full analysis complete. ZIP archive: %s", archive_path)
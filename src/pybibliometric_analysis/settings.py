@@ -1,19 +1,46 @@
 import hashlib
-import json
 import os
 import platform
 import subprocess
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from functools import lru_cache
 from importlib import import_module, metadata
 from importlib.util import find_spec
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import yaml
 
+from pybibliometric_analysis.io_utils import write_json
 
-@dataclass(frozen=True)
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _SafeLoader
+
+_PYTHON_VERSION = platform.python_version()
+
+
+_CFG_HEADER_PREFIX = "# generated by pybibliometric_analysis; content-hash: "
+
+# pybliometrics.cfg [Directories] entries; each caches under cache_root/<name.lower()>.
+_PYBLIOMETRICS_CACHE_SECTIONS = (
+    "AbstractRetrieval",
+    "AffiliationRetrieval",
+    "AffiliationSearch",
+    "AuthorRetrieval",
+    "AuthorSearch",
+    "CitationOverview",
+    "PlumXMetrics",
+    "ScopusSearch",
+    "SerialTitleSearch",
+    "SerialTitleISSN",
+    "SubjectClassifications",
+)
+
+
+@dataclass(frozen=True, slots=True)
 class SearchConfig:
     query: str
     database: str
@@ -25,13 +52,24 @@ class SearchConfig:
     max_years_back: Optional[int]
 
 
+# Resolved config path -> (mtime_ns, size, parsed config); SearchConfig is frozen, so
+# sharing one instance between callers is safe.
+_SEARCH_CONFIG_CACHE: Dict[str, Tuple[int, int, SearchConfig]] = {}
+
+
 def load_search_config(path: Path) -> SearchConfig:
+    stat = path.stat()
+    cache_key = str(path.resolve())
+    cached = _SEARCH_CONFIG_CACHE.get(cache_key)
+    if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+        return cached[2]
+
     with path.open("r", encoding="utf-8") as handle:
-        data = yaml.safe_load(handle) or {}
+        data = yaml.load(handle, Loader=_SafeLoader) or {}
     start_year = data.get("start_year")
     end_year = data.get("end_year")
     max_years_back = data.get("max_years_back")
-    return SearchConfig(
+    config = SearchConfig(
         query=str(data.get("query", "")),
         database=str(data.get("database", "")),
         notes=str(data.get("notes", "")),
@@ -41,6 +79,12 @@ def load_search_config(path: Path) -> SearchConfig:
         end_year=int(end_year) if end_year is not None else None,
         max_years_back=int(max_years_back) if max_years_back is not None else None,
     )
+    _SEARCH_CONFIG_CACHE[cache_key] = (stat.st_mtime_ns, stat.st_size, config)
+    return config
+
+
+def clear_search_config_cache() -> None:
+    _SEARCH_CONFIG_CACHE.clear()
 
 
 def generate_run_id(prefix: str = "smoke") -> str:
@@ -49,12 +93,14 @@ def generate_run_id(prefix: str = "smoke") -> str:
 
 
 def _read_first_token(path: Path) -> Optional[str]:
-    lines = load_text_file(path).splitlines()
-    for line in lines:
-        cleaned = line.split("#", 1)[0].strip()
-        if not cleaned:
-            continue
-        return cleaned
+    try:
+        with path.open("r", encoding="utf-8") as handle:
+            for line in handle:
+                cleaned = line.split("#", 1)[0].strip()
+                if cleaned:
+                    return cleaned
+    except FileNotFoundError:
+        pass
     return None
 
 
@@ -71,17 +117,16 @@ def load_scopus_api_key_with_source(
     api_key_file: Optional[Path],
 ) -> tuple[Optional[str], Optional[str]]:
     default_file = Path("config/scopus_api_key.txt")
-    if api_key_file and api_key_file.exists():
+    if api_key_file:
         cleaned = _read_first_token(api_key_file)
         if cleaned and cleaned != "YOUR_SCOPUS_API_KEY_HERE":
             return cleaned, "file"
     env_key = os.getenv("SCOPUS_API_KEY")
     if env_key:
         return env_key.strip() or None, "env"
-    if default_file.exists():
-        cleaned = _read_first_token(default_file)
-        if cleaned and cleaned != "YOUR_SCOPUS_API_KEY_HERE":
-            return cleaned, "default_file"
+    cleaned = _read_first_token(default_file)
+    if cleaned and cleaned != "YOUR_SCOPUS_API_KEY_HERE":
+        return cleaned, "default_file"
     return None, None
 
 
@@ -94,7 +139,7 @@ def load_scopus_insttoken_with_source(
     inst_token_file: Optional[Path] = None,
 ) -> tuple[Optional[str], Optional[str]]:
     default_file = Path("config/inst_token.txt")
-    if inst_token_file and inst_token_file.exists():
+    if inst_token_file:
         cleaned = _read_first_token(inst_token_file)
         if cleaned and cleaned != "YOUR_INST_TOKEN_HERE":
             return cleaned, "file"
@@ -104,10 +149,9 @@ def load_scopus_insttoken_with_source(
     env_token = os.getenv("INSTTOKEN")
     if env_token:
         return env_token.strip() or None, "env_compat"
-    if default_file.exists():
-        cleaned = _read_first_token(default_file)
-        if cleaned and cleaned != "YOUR_INST_TOKEN_HERE":
-            return cleaned, "default_file"
+    cleaned = _read_first_token(default_file)
+    if cleaned and cleaned != "YOUR_INST_TOKEN_HERE":
+        return cleaned, "default_file"
     return None, None
 
 
@@ -119,11 +163,13 @@ def ensure_pybliometrics_cfg(
     config_dir.mkdir(parents=True, exist_ok=True)
     cfg_path = config_dir / "pybliometrics.cfg"
 
-    if not cfg_path.exists() and api_key:
+    if api_key:
         cache_root = (Path.cwd() / ".cache" / "pybliometrics").resolve()
-        cache_root.mkdir(parents=True, exist_ok=True)
-        cfg_text = _render_pybliometrics_cfg(cache_root, api_key, inst_token)
-        cfg_path.write_text(cfg_text, encoding="utf-8")
+        header = _cfg_header(cache_root, api_key, inst_token)
+        if _cfg_needs_render(cfg_path, header):
+            cache_root.mkdir(parents=True, exist_ok=True)
+            cfg_text = _render_pybliometrics_cfg(cache_root, api_key, inst_token)
+            cfg_path.write_text(f"{header}\n{cfg_text}", encoding="utf-8")
 
     if not cfg_path.exists() and not api_key:
         raise RuntimeError(
@@ -135,6 +181,26 @@ def ensure_pybliometrics_cfg(
     return cfg_path
 
 
+def _cfg_header(cache_root: Path, api_key: str, inst_token: Optional[str]) -> str:
+    fingerprint = hashlib.sha256(
+        "\0".join((str(cache_root), api_key, inst_token or "")).encode("utf-8")
+    ).hexdigest()
+    return f"{_CFG_HEADER_PREFIX}{fingerprint}"
+
+
+def _cfg_needs_render(cfg_path: Path, header: str) -> bool:
+    """Render when the cfg is missing, or was generated here for other credentials.
+
+    A cfg without the generated header was written by hand and is never overwritten.
+    """
+    try:
+        with cfg_path.open("r", encoding="utf-8") as handle:
+            first_line = handle.readline().rstrip("\n")
+    except FileNotFoundError:
+        return True
+    return first_line.startswith(_CFG_HEADER_PREFIX) and first_line != header
+
+
 def ensure_pybliometrics_config(
     config_dir: Path,
     api_key_file: Optional[Path] = None,
@@ -189,54 +255,50 @@ def _resolve_pybliometrics_init():
 
 
 def _render_pybliometrics_cfg(cache_root: Path, api_key: str, insttoken: Optional[str]) -> str:
-    sections = {
-        "AbstractRetrieval": cache_root / "abstractretrieval",
-        "AffiliationRetrieval": cache_root / "affiliationretrieval",
-        "AffiliationSearch": cache_root / "affiliationsearch",
-        "AuthorRetrieval": cache_root / "authorretrieval",
-        "AuthorSearch": cache_root / "authorsearch",
-        "CitationOverview": cache_root / "citationoverview",
-        "PlumXMetrics": cache_root / "plumxmetrics",
-        "ScopusSearch": cache_root / "scopussearch",
-        "SerialTitleSearch": cache_root / "serialtitlesearch",
-        "SerialTitleISSN": cache_root / "serialtitleissn",
-        "SubjectClassifications": cache_root / "subjectclassifications",
-    }
-    lines = ["[Directories]"]
-    for name, path in sections.items():
+    directories = []
+    for name in _PYBLIOMETRICS_CACHE_SECTIONS:
+        path = cache_root / name.lower()
         path.mkdir(parents=True, exist_ok=True)
-        lines.append(f"{name} = {path}")
-    lines.append("")
-    lines.append("[Authentication]")
-    lines.append(f"APIKey = {api_key}")
-    if insttoken:
-        lines.append(f"InstToken = {insttoken}")
-    lines.append("")
-    lines.append("[Requests]")
-    lines.append("Timeout = 20")
-    lines.append("Retries = 5")
-    lines.append("")
-    return "\n".join(lines)
+        directories.append(f"{name} = {path}")
+    inst_line = f"InstToken = {insttoken}\n" if insttoken else ""
+    return (
+        "[Directories]\n"
+        + "\n".join(directories)
+        + f"\n\n[Authentication]\nAPIKey = {api_key}\n{inst_line}"
+        + "\n[Requests]\nTimeout = 20\nRetries = 5\n"
+    )
 
 
-def get_package_versions() -> Dict[str, Optional[str]]:
-    packages = ["pybliometrics", "pandas", "numpy", "pyarrow"]
-    versions: Dict[str, Optional[str]] = {}
-    for package in packages:
+@lru_cache(maxsize=1)
+def _installed_versions() -> Tuple[Tuple[str, Optional[str]], ...]:
+    # Installed distributions do not change within a process; each lookup scans sys.path.
+    versions = []
+    for package in ("pybliometrics", "pandas", "numpy", "pyarrow"):
         try:
-            versions[package] = metadata.version(package)
+            versions.append((package, metadata.version(package)))
         except metadata.PackageNotFoundError:
-            versions[package] = None
-    return versions
+            versions.append((package, None))
+    return tuple(versions)
+
+
+def get_package_versions() -> Dict[str, Optional[str]]:
+    return dict(_installed_versions())
 
 
 def get_git_commit() -> Optional[str]:
+    return _git_commit(os.getcwd())
+
+
+@lru_cache(maxsize=8)
+def _git_commit(cwd: str) -> Optional[str]:
+    # HEAD does not move during a run; keyed by cwd because git resolves the repo from it.
     try:
         result = subprocess.run(
             ["git", "rev-parse", "HEAD"],
             check=True,
             capture_output=True,
             text=True,
+            cwd=cwd,
         )
         return result.stdout.strip()
     except (subprocess.CalledProcessError, FileNotFoundError):
@@ -263,7 +325,7 @@ def build_manifest(
         "n_records_downloaded": n_records_downloaded,
         "strategy_used": strategy_used,
         "years_covered": years_covered,
-        "python_version": platform.python_version(),
+        "python_version": _PYTHON_VERSION,
         "package_versions": get_package_versions(),
         "columns_present": columns_present,
         "git_commit": get_git_commit(),
@@ -271,8 +333,13 @@ def build_manifest(
 
 
 def compute_file_hash(path: Path) -> str:
-    data = path.read_bytes()
-    return hashlib.sha256(data).hexdigest()
+    with path.open("rb") as handle:
+        if hasattr(hashlib, "file_digest"):  # Python 3.11+
+            return hashlib.file_digest(handle, "sha256").hexdigest()
+        digest = hashlib.sha256()
+        for chunk in iter(lambda: handle.read(1 << 20), b""):
+            digest.update(chunk)
+        return digest.hexdigest()
 
 
 def sha256_file(path: Path) -> str:
@@ -280,5 +347,4 @@ def sha256_file(path: Path) -> str:
 
 
 def write_manifest(path: Path, manifest: Dict[str, Any]) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(manifest, indent=2, sort_keys=True), encoding="utf-8")
+    write_json(manifest, path)
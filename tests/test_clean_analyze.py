@@ -2,9 +2,11 @@ import shutil
 from pathlib import Path
 
 import pandas as pd
+import pytest
 
+from pybibliometric_analysis import clean_scopus
 from pybibliometric_analysis.analyze_bibliometrics import run_analyze
-from pybibliometric_analysis.clean_scopus import run_clean
+from pybibliometric_analysis.clean_scopus import _clean_columns, _split_and_count, run_clean
 
 
 def _copy_fixture(base_dir: Path, run_id: str) -> Path:
@@ -51,3 +53,33 @@ def test_clean_and_analyze(tmp_path):
     assert yoy_path.exists()
     assert cagr_path.exists()
     assert analysis_manifest.exists()
+
+
+def test_clean_columns_derives_pub_year_from_cover_date():
+    df = pd.DataFrame(
+        {
+            "pub_year": [2019, None, None, None],
+            "coverDate": ["2020-01-01", " 2021-06-15", "n/a", None],
+            "publicationName": [" Journal A ", None, "Journal B", "Journal A"],
+        }
+    )
+
+    cleaned = _clean_columns(df)
+    years = cleaned["pub_year"]
+
+    assert years.iloc[:2].tolist() == [2019.0, 2021.0]
+    assert years.iloc[2:].isna().all()
+    assert cleaned["publicationName"].value_counts().to_dict() == {"Journal A": 2, "Journal B": 1}
+
+
+@pytest.mark.parametrize("arrow", [False, True])
+def test_split_and_count_orders_ties_by_value(monkeypatch, arrow):
+    if arrow:
+        pytest.importorskip("pyarrow")
+    monkeypatch.setattr(clean_scopus, "detect_parquet_support", lambda: arrow)
+    series = pd.Series(["zeta; beta", "alpha;zeta", "gamma; beta", None, "alpha"])
+
+    counts = _split_and_count(series)
+
+    assert counts["item"].tolist() == ["alpha", "beta", "zeta", "gamma"]
+    assert counts["count"].tolist() == [2, 2, 2, 1]
@@ -0,0 +1,30 @@
+import math
+import tracemalloc
+
+import pandas as pd
+
+from pybibliometric_analysis.frame_utils import count_by_year, cover_years
+
+
+def test_cover_years_takes_leading_iso_year_only():
+    dates = pd.Series(["2020-01-01", " 2021-05-01", "12.5.2020", "-2021", "n/a", None])
+
+    years = cover_years(dates).tolist()
+
+    assert years[:2] == [2020.0, 2021.0]
+    assert all(math.isnan(year) for year in years[2:])
+
+
+def test_count_by_year_handles_outlier_year_without_dense_histogram():
+    years = pd.Series([2020.0, 2021.0, 2020.0, None, 20200101.0])
+
+    tracemalloc.start()
+    try:
+        counts = count_by_year(years)
+        _current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert counts["pub_year"].tolist() == [2020.0, 2021.0, 20200101.0]
+    assert counts["count"].tolist() == [2, 1, 1]
+    assert peak < 10_000_000
@@ -1,6 +1,16 @@
+import json
+import zipfile
 from pathlib import Path
 
-from pybibliometric_analysis.scopus_full_analysis import run_full_scopus_csv_analysis
+import pandas as pd
+
+from pybibliometric_analysis.scopus_full_analysis import (
+    _extract_countries,
+    _keyword_lists,
+    _norm_text,
+    _split_keywords,
+    run_full_scopus_csv_analysis,
+)
 
 
 def test_run_full_scopus_csv_analysis_creates_outputs(tmp_path: Path):
@@ -16,7 +26,91 @@ def test_run_full_scopus_csv_analysis_creates_outputs(tmp_path: Path):
     )
 
     output_root = tmp_path / "outputs" / "full_analysis" / run_id
-    assert (output_root / "tables" / "dataset_scope.csv").exists()
+    manifest = json.loads((output_root / "meta" / "manifest.json").read_text(encoding="utf-8"))
+    assert Path(manifest["dataset_scope"]["path"]).exists()
+    assert Path(manifest["dataset_scope"]["path"]).stem == "dataset_scope"
     assert (output_root / "tables" / "pubs_by_year.csv").exists()
     assert (output_root / "meta" / "manifest.json").exists()
-    assert (tmp_path / "outputs" / "full_analysis" / f"{run_id}.zip").exists()
+    archive_path = tmp_path / "outputs" / "full_analysis" / f"{run_id}.zip"
+    with zipfile.ZipFile(archive_path) as archive:
+        assert "tables/pubs_by_year.csv" in archive.namelist()
+        assert "figures/" in archive.namelist()
+        assert archive.getinfo("tables/pubs_by_year.csv").compress_type == zipfile.ZIP_DEFLATED
+
+
+def test_full_analysis_years_from_padded_and_non_iso_cover_dates(tmp_path: Path):
+    csv_path = tmp_path / "export.csv"
+    csv_path.write_text(
+        "eid,coverDate,title\n"
+        "1,2020-01-01,Alpha\n"
+        "2, 2021-05-01,Beta\n"
+        "3,12.5.2020,Gamma\n"
+        "4,-2021,Delta\n",
+        encoding="utf-8",
+    )
+
+    run_full_scopus_csv_analysis(
+        run_id="dates",
+        csv_path=csv_path,
+        base_dir=tmp_path,
+        min_year=0,
+        max_year=2025,
+    )
+
+    tables = tmp_path / "outputs" / "full_analysis" / "dates" / "tables"
+    pubs = pd.read_csv(tables / "pubs_by_year.csv")
+    assert pubs["year"].tolist() == [2020, 2021]
+    assert pubs["n_pubs"].tolist() == [1, 1]
+
+
+def test_full_analysis_out_of_range_year_does_not_wrap_into_scope(tmp_path: Path):
+    csv_path = tmp_path / "export.csv"
+    csv_path.write_text(
+        "EID,Year,Title\n1,2020,Alpha\n2,2021,Beta\n3,67556,Gamma\n4,20200101,Delta\n",
+        encoding="utf-8",
+    )
+
+    run_full_scopus_csv_analysis(
+        run_id="years",
+        csv_path=csv_path,
+        base_dir=tmp_path,
+        min_year=2000,
+        max_year=2025,
+    )
+
+    tables = tmp_path / "outputs" / "full_analysis" / "years" / "tables"
+    pubs = pd.read_csv(tables / "pubs_by_year.csv")
+    assert pubs["year"].tolist() == [2020, 2021]
+    assert pubs["n_pubs"].tolist() == [1, 1]
+
+
+def test_keyword_lists_are_normalized_sorted_and_distinct():
+    author_kw = pd.Series(["Sukuk;  Islamic   Finance ", None, "zakat"], index=[10, 11, 12])
+    index_kw = pd.Series(["islamic finance; ", "", "Waqf;ZAKAT"], index=[10, 11, 12])
+
+    lists = _keyword_lists(
+        [_split_keywords(author_kw), _split_keywords(index_kw)], author_kw.index
+    )
+
+    assert lists.to_dict() == {
+        10: ["islamic finance", "sukuk"],
+        11: [],
+        12: ["waqf", "zakat"],
+    }
+
+
+def test_extract_countries_keeps_one_row_per_document_country():
+    affiliations = pd.Series(
+        [None, "Univ A, UK; Univ B, United Kingdom; Univ C, USA;", " ; Lab,"], index=[5, 6, 7]
+    )
+
+    countries = _extract_countries(affiliations)
+
+    assert countries.index.tolist() == [6, 6]
+    assert countries.tolist() == ["united kingdom", "united states"]
+
+
+def test_norm_text_collapses_unicode_whitespace_like_python_re():
+    titles = pd.Series([" Islamic  Finance\t", None, "Sukuk\x0bMarkets"])
+
+    assert _norm_text(titles).tolist() == ["islamic finance", "", "sukuk markets"]
@@ -1,6 +1,8 @@
+import sys
 from pathlib import Path
 
 import pandas as pd
+import pytest
 
 from pybibliometric_analysis import io_utils
 
@@ -20,6 +22,28 @@ def test_write_table_falls_back_to_csv(tmp_path, monkeypatch):
     assert Path(output["path"]).exists()
 
 
+def test_write_table_falls_back_to_csv_on_mixed_type_column(tmp_path):
+    df = pd.DataFrame({"eid": ["1", "2"], "volume": ["12", 7]})
+
+    output = io_utils.write_table(df, tmp_path / "dataset_scope")
+
+    assert output["format"] == "csv"
+    assert not (tmp_path / "dataset_scope.parquet").exists()
+    assert io_utils.read_table(tmp_path / "dataset_scope")["volume"].tolist() == [12, 7]
+
+
+def test_write_table_falls_back_to_csv_without_codec(tmp_path, monkeypatch):
+    pa_lib = pytest.importorskip("pyarrow.lib")
+
+    def _raise_codec(*_args, **_kwargs):
+        raise pa_lib.ArrowNotImplementedError("Support for codec 'zstd' not built")
+
+    monkeypatch.setattr(pd.DataFrame, "to_parquet", _raise_codec, raising=True)
+
+    output = io_utils.write_table(pd.DataFrame({"a": [1]}), tmp_path / "data")
+    assert output["format"] == "csv"
+
+
 def test_read_table_parquet_fallback(tmp_path, monkeypatch):
     csv_path = tmp_path / "data.csv"
     df = pd.DataFrame({"a": [3, 4]})
@@ -29,3 +53,56 @@ def test_read_table_parquet_fallback(tmp_path, monkeypatch):
     parquet_path = tmp_path / "data"
     loaded = io_utils.read_table(parquet_path)
     assert loaded["a"].tolist() == [3, 4]
+
+
+def test_read_table_projects_columns(tmp_path):
+    df = pd.DataFrame({"a": [1, 2], "b": ["x", "y"]})
+    df.to_csv(tmp_path / "data.csv", index=False)
+
+    loaded = io_utils.read_table(tmp_path / "data", columns=["a"])
+    assert list(loaded.columns) == ["a"]
+
+
+def test_write_table_forced_csv_round_trips(tmp_path):
+    df = pd.DataFrame({"eid": ["1", "2"], "title": ["a, b", None], "pub_year": [2020, 2021]})
+    output = io_utils.write_table(df, tmp_path / "cleaned.csv")
+
+    assert output["format"] == "csv"
+    assert (tmp_path / "cleaned.csv").read_text(encoding="utf-8") == df.to_csv(index=False)
+    loaded = io_utils.read_table(tmp_path / "cleaned.csv", columns=["title", "pub_year"])
+    assert loaded["title"].iloc[0] == "a, b"
+    assert loaded["pub_year"].tolist() == [2020, 2021]
+
+
+def test_write_json_round_trips_sorted(tmp_path):
+    path = tmp_path / "meta" / "manifest.json"
+    io_utils.write_json({"b": 1, "a": {"query": "sukuk"}}, path)
+
+    assert io_utils.read_json(path) == {"a": {"query": "sukuk"}, "b": 1}
+    text = path.read_text(encoding="utf-8")
+    assert text.index('"a"') < text.index('"b"')
+
+
+def test_write_json_stdlib_fallback_matches_orjson(tmp_path, monkeypatch):
+    orjson = pytest.importorskip("orjson")
+    data = {"query": "Islamic finance – ṣukūk", "cagr": float("nan"), "years": [2020, 2021]}
+    expected = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+
+    monkeypatch.setitem(sys.modules, "orjson", None)
+    io_utils.write_json(data, tmp_path / "manifest.json")
+
+    assert (tmp_path / "manifest.json").read_bytes() == expected
+
+
+def test_setup_logger_reuses_handler_for_same_path(tmp_path):
+    log_path = tmp_path / "logs" / "clean_x.log"
+    logger = io_utils.setup_logger("pybibliometric_analysis.test_io_utils", log_path)
+    handlers = list(logger.handlers)
+
+    assert io_utils.setup_logger("pybibliometric_analysis.test_io_utils", log_path) is logger
+    assert logger.handlers == handlers
+
+    logger.info("hello")
+    for handler in logger.handlers:
+        handler.close()
+    assert "hello" in log_path.read_text(encoding="utf-8")
@@ -5,7 +5,7 @@ from collections import namedtuple
 import pandas as pd
 import pytest
 
-from pybibliometric_analysis import settings
+from pybibliometric_analysis import extract_scopus, settings
 from pybibliometric_analysis.extract_scopus import run_extract
 
 Document = namedtuple("Document", ["eid", "title"])
@@ -38,6 +38,24 @@ def test_load_yaml(tmp_path):
     assert config.use_cursor_preferred is True
 
 
+def test_load_search_config_reuses_parse_until_file_changes(tmp_path):
+    import os
+
+    config_path = tmp_path / "search.yaml"
+    config_path.write_text("query: 'a'\ndatabase: 'Scopus'\n", encoding="utf-8")
+
+    first = settings.load_search_config(config_path)
+    assert settings.load_search_config(config_path) is first
+
+    config_path.write_text("query: 'b'\ndatabase: 'Scopus'\n", encoding="utf-8")
+    stat = config_path.stat()
+    os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert settings.load_search_config(config_path).query == "b"
+    settings.clear_search_config_cache()
+    assert settings.load_search_config(config_path) is not first
+
+
 def test_run_id_generation():
     run_id = settings.generate_run_id()
     assert run_id.endswith("Z")
@@ -52,7 +70,8 @@ def test_no_overwrite_raw(tmp_path, monkeypatch):
     (tmp_path / "logs").mkdir(parents=True, exist_ok=True)
 
     monkeypatch.setattr(
-        "pybibliometric_analysis.extract_scopus.build_paths",
+        extract_scopus,
+        "build_paths",
         lambda base_dir, run_id: type(
             "Paths",
             (),
@@ -120,13 +139,15 @@ def test_extract_uses_mocked_scopus(monkeypatch, tmp_path):
         encoding="utf-8",
     )
 
-    monkeypatch.setattr("pybibliometric_analysis.extract_scopus.ScopusSearch", DummySearch)
+    monkeypatch.setattr(extract_scopus, "ScopusSearch", DummySearch)
     monkeypatch.setattr(
-        "pybibliometric_analysis.extract_scopus.init_pybliometrics",
+        extract_scopus,
+        "init_pybliometrics",
         lambda *_args, **_kwargs: None,
     )
     monkeypatch.setattr(
-        "pybibliometric_analysis.extract_scopus.write_table",
+        extract_scopus,
+        "write_table",
         lambda df, path: df.to_csv(path.with_suffix(".csv"), index=False)
         or {"path": str(path.with_suffix(".csv")), "format": "csv"},
     )
@@ -232,7 +253,8 @@ def test_no_secret_logged(tmp_path, caplog, monkeypatch):
     api_key_file.write_text("SECRET_KEY\n", encoding="utf-8")
     logger = logging.getLogger("pybibliometric_analysis.test")
     monkeypatch.setattr(
-        "pybibliometric_analysis.settings._resolve_pybliometrics_init",
+        settings,
+        "_resolve_pybliometrics_init",
         lambda: None,
     )
     with caplog.at_level(logging.INFO):
@@ -243,3 +265,205 @@ def test_no_secret_logged(tmp_path, caplog, monkeypatch):
             logger=logger,
         )
     assert "SECRET_KEY" not in caplog.text
+
+
+def test_retry_scopus_search_backs_off_exponentially(monkeypatch):
+    attempts = []
+    sleeps = []
+
+    class FlakySearch:
+        def __init__(self, query, view=None, download=True, subscriber=True):
+            attempts.append(query)
+            if len(attempts) < 3:
+                raise ConnectionError("transient")
+            self.results = []
+
+    monkeypatch.setattr(extract_scopus, "ScopusSearch", FlakySearch)
+    monkeypatch.setattr(extract_scopus.time, "sleep", sleeps.append)
+    monkeypatch.setattr(extract_scopus.random, "uniform", lambda _a, _b: 0.0)
+
+    extract_scopus.retry_scopus_search("q", view=None, base_delay=1.0, max_delay=30.0)
+
+    assert len(attempts) == 3
+    assert sleeps == [1.0, 2.0]
+
+
+def test_retry_scopus_search_honours_retry_after(monkeypatch):
+    class Response:
+        headers = {"Retry-After": "7"}
+
+    class Unavailable(Exception):
+        response = Response()
+
+    sleeps = []
+
+    class BusySearch:
+        def __init__(self, query, view=None, download=True, subscriber=True):
+            raise Unavailable("busy")
+
+    monkeypatch.setattr(extract_scopus, "ScopusSearch", BusySearch)
+    monkeypatch.setattr(extract_scopus.time, "sleep", sleeps.append)
+
+    with pytest.raises(Unavailable):
+        extract_scopus.retry_scopus_search("q", view=None, retries=2)
+
+    assert sleeps == [7.0]
+
+
+def test_retry_scopus_search_fails_fast_on_unrecoverable_errors(monkeypatch):
+    from pybliometrics.exception import Scopus401Error, ScopusQueryError
+
+    attempts = []
+    sleeps = []
+
+    def failing_search(exc):
+        class FailingSearch:
+            def __init__(self, query, view=None, download=True, subscriber=True):
+                attempts.append(query)
+                raise exc
+
+        return FailingSearch
+
+    monkeypatch.setattr(extract_scopus.time, "sleep", sleeps.append)
+
+    monkeypatch.setattr(extract_scopus, "ScopusSearch", failing_search(Scopus401Error("no")))
+    with pytest.raises(RuntimeError, match="Unauthorized"):
+        extract_scopus.retry_scopus_search("q", view=None)
+
+    monkeypatch.setattr(extract_scopus, "ScopusSearch", failing_search(ScopusQueryError("bad")))
+    with pytest.raises(ScopusQueryError):
+        extract_scopus.retry_scopus_search("q", view=None)
+
+    assert len(attempts) == 2
+    assert sleeps == []
+
+
+def test_retry_scopus_search_retries_rate_limits_by_exception_class(monkeypatch):
+    from pybliometrics.exception import Scopus429Error
+
+    attempts = []
+    sleeps = []
+
+    class Timeout(Exception):
+        pass
+
+    def failing_search(exc):
+        class FailingSearch:
+            def __init__(self, query, view=None, download=True, subscriber=True):
+                attempts.append(query)
+                raise exc
+
+        return FailingSearch
+
+    monkeypatch.setattr(extract_scopus.time, "sleep", sleeps.append)
+    monkeypatch.setattr(extract_scopus.random, "uniform", lambda _a, _b: 0.0)
+
+    monkeypatch.setattr(extract_scopus, "ScopusSearch", failing_search(Scopus429Error("slow")))
+    with pytest.raises(RuntimeError, match="Rate limited"):
+        extract_scopus.retry_scopus_search("q", view=None, retries=3)
+    assert len(attempts) == 3
+    assert sleeps == [1.0, 2.0]
+
+    monkeypatch.setattr(extract_scopus, "ScopusSearch", failing_search(Timeout("lookalike")))
+    with pytest.raises(Timeout):
+        extract_scopus.retry_scopus_search("q", view=None, retries=3)
+    assert len(attempts) == 4
+
+
+def test_run_slicing_keeps_year_order(monkeypatch):
+    calls = []
+
+    class YearSearch:
+        def __init__(self, query, view=None, download=True, subscriber=True):
+            calls.append(download)
+            year = int(query.rsplit("=", 1)[1])
+            self.results = [] if year == 2021 else [Document(eid=str(year), title="T")]
+            if year == 2023:
+                # Scopus can list a record under two adjacent PUBYEAR slices.
+                self.results.append(Document(eid="2022", title="T"))
+
+    monkeypatch.setattr(extract_scopus, "ScopusSearch", YearSearch)
+
+    frame, covered = extract_scopus.run_slicing(
+        "q",
+        None,
+        start_year=2019,
+        end_year=2023,
+        max_years_back=None,
+        subscriber=False,
+        max_workers=3,
+    )
+
+    assert covered == [2019, 2020, 2022, 2023]
+    assert frame["eid"].tolist() == ["2019", "2020", "2022", "2023"]
+    assert calls == [True] * 5
+
+
+def test_run_slicing_serializes_concurrent_searches(monkeypatch):
+    import threading
+    import time
+
+    in_flight = []
+    peak = []
+    guard = threading.Lock()
+
+    class ThrottledSearch:
+        def __init__(self, query, view=None, download=True, subscriber=True):
+            with guard:
+                in_flight.append(query)
+                peak.append(len(in_flight))
+            time.sleep(0.01)
+            with guard:
+                in_flight.remove(query)
+            self.results = [Document(eid=query, title="T")]
+
+    monkeypatch.setattr(extract_scopus, "ScopusSearch", ThrottledSearch)
+
+    frame, covered = extract_scopus.run_slicing(
+        "q",
+        None,
+        start_year=2015,
+        end_year=2022,
+        max_years_back=None,
+        subscriber=False,
+        max_workers=4,
+    )
+
+    assert covered == list(range(2015, 2023))
+    assert len(frame) == 8
+    assert max(peak) == 1
+
+
+def test_actionable_error_matches_pybliometrics_subclasses():
+    from pybliometrics.exception import Scopus401Error
+
+    class ExpiredKeyError(Scopus401Error):
+        pass
+
+    with pytest.raises(RuntimeError, match="Unauthorized"):
+        extract_scopus._raise_actionable_scopus_error(ExpiredKeyError("expired"))
+    extract_scopus._raise_actionable_scopus_error(ValueError("not actionable"))
+
+
+def test_generated_pybliometrics_cfg_is_refreshed_only_when_credentials_change(
+    monkeypatch, tmp_path
+):
+    import configparser
+
+    monkeypatch.chdir(tmp_path)
+    config_dir = tmp_path / "cfg"
+    cfg_path = settings.ensure_pybliometrics_cfg(config_dir, "KEY_A", None)
+    first = cfg_path.read_text(encoding="utf-8")
+    parser = configparser.ConfigParser()
+    parser.read_string(first)
+    assert parser["Authentication"]["APIKey"] == "KEY_A"
+
+    settings.ensure_pybliometrics_cfg(config_dir, "KEY_A", None)
+    assert cfg_path.read_text(encoding="utf-8") == first
+
+    settings.ensure_pybliometrics_cfg(config_dir, "KEY_B", "TOKEN")
+    assert "APIKey = KEY_B" in cfg_path.read_text(encoding="utf-8")
+
+    cfg_path.write_text("[Authentication]\nAPIKey = HAND_WRITTEN\n", encoding="utf-8")
+    settings.ensure_pybliometrics_cfg(config_dir, "KEY_C", None)
+    assert "HAND_WRITTEN" in cfg_path.read_text(encoding="utf-8")